@@ -1,11 +1,26 @@
 import os
 
 import uvicorn
+from dotenv import load_dotenv
 
 
 if __name__ == "__main__":
+    # Same .env the app reads, so APP_ENV / WEB_CONCURRENCY / PORT set there apply here too
+    load_dotenv()
     port = int(os.getenv("PORT", 5000))
+    # Auto-reload is opt-in (APP_ENV=development); it forces a single process and adds a file watcher
+    reload = os.getenv("APP_ENV") == "development"
+    # One process per core by default
+    workers = 1 if reload else int(os.getenv("WEB_CONCURRENCY") or os.cpu_count() or 2)
+    # Workers inherit this and split DB_MAX_CONNECTIONS between them (see src/database.py)
+    os.environ["WEB_CONCURRENCY"] = str(workers)
     # Boot the FastAPI app defined in src/main.py
-    uvicorn.run("src.main:app", host="0.0.0.0", port=port, reload=True)
-
-
+    uvicorn.run(
+        "src.main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        reload=reload,
+        workers=None if reload else workers,
+    )
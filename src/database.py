@@ -1,26 +1,35 @@
-from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+import functools
 import os
+import uuid
+from typing import Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Prefer discrete DB_* variables when present (Docker local). Fallback to DATABASE_URL.
-db_user = os.getenv("DB_USER")
-db_password = os.getenv("DB_PASSWORD")
-db_host = os.getenv("DB_HOST")
-db_port = os.getenv("DB_PORT", "5432")
-db_name = os.getenv("DB_NAME")
-db_sslmode = os.getenv("DB_SSLMODE")  # e.g., require
-
-if db_user and db_password and db_host and db_name:
-    DATABASE_URL = f"postgresql+psycopg2://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-    if db_sslmode:
-        DATABASE_URL += f"?sslmode={db_sslmode}"
-else:
-    DATABASE_URL = os.getenv("DATABASE_URL")
-    if not DATABASE_URL:
+Base = declarative_base()
+
+def _database_url() -> URL:
+    # Prefer discrete DB_* variables when present (Docker local). Fallback to DATABASE_URL.
+    db_user = os.getenv("DB_USER")
+    db_password = os.getenv("DB_PASSWORD")
+    db_host = os.getenv("DB_HOST")
+    db_port = os.getenv("DB_PORT", "5432")
+    db_name = os.getenv("DB_NAME")
+    db_sslmode = os.getenv("DB_SSLMODE")  # e.g., require
+
+    if db_user and db_password and db_host and db_name:
+        url = f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+        if db_sslmode:
+            # asyncpg takes `ssl` rather than libpq's `sslmode`
+            url += f"?ssl={db_sslmode}"
+        return make_url(url)
+
+    url = os.getenv("DATABASE_URL")
+    if not url:
         missing = [k for k, v in {
             "DB_USER": db_user,
             "DB_PASSWORD": db_password,
@@ -32,14 +41,67 @@ else:
             f"Missing required database env vars: {', '.join(missing)}. "
             "Set DB_USER/DB_PASSWORD/DB_HOST/DB_NAME (optional DB_PORT, DB_SSLMODE) or provide DATABASE_URL."
         )
+    parsed = make_url(url)
+    # Hosted providers hand out postgres:// or postgresql:// URLs; force the asyncpg driver.
+    if parsed.drivername in ("postgres", "postgresql", "postgresql+psycopg2"):
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    # Query params go straight to asyncpg.connect(), which takes `ssl`, not libpq's `sslmode`
+    if "sslmode" in parsed.query:
+        sslmode = parsed.query["sslmode"]
+        parsed = parsed.difference_update_query(["sslmode"]).update_query_dict({"ssl": sslmode})
+    return parsed
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+def _pool_sizes() -> Tuple[int, int]:
+    """Per-worker (pool_size, max_overflow).
+
+    Every worker holds its own pool, so the defaults split DB_MAX_CONNECTIONS
+    across WEB_CONCURRENCY workers (capped at 10 + 20). Explicit DB_POOL_SIZE /
+    DB_MAX_OVERFLOW win.
+    """
+    budget = int(os.getenv("DB_MAX_CONNECTIONS", "80"))
+    workers = max(int(os.getenv("WEB_CONCURRENCY") or 1), 1)
+    per_worker = max(budget // workers, 2)
+    pool_size = int(os.getenv("DB_POOL_SIZE") or max(1, min(10, per_worker // 3)))
+    max_overflow = int(os.getenv("DB_MAX_OVERFLOW") or max(0, min(20, per_worker - pool_size)))
+    return pool_size, max_overflow
+
+@functools.lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Build the process-wide engine on first use rather than at import time."""
+    if os.getenv("DB_PGBOUNCER") == "1":
+        # PgBouncer in transaction mode does the pooling and may hand each transaction
+        # a different backend. Keep no app-side pool and no statement caches, and give
+        # every prepared statement a unique name: asyncpg's per-connection counter
+        # names (__asyncpg_stmt_1__, ...) collide between clients on a shared backend.
+        return create_async_engine(
+            _database_url(),
+            poolclass=NullPool,
+            connect_args={
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            },
+        )
+    pool_size, max_overflow = _pool_sizes()
+    return create_async_engine(
+        _database_url(),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        # Cheap liveness check on checkout instead of failing mid-query on a stale socket
+        pool_pre_ping=True,
+    )
+
+@functools.lru_cache(maxsize=1)
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=get_engine(),
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with get_sessionmaker()() as db:
         yield db
-    finally:
-        db.close()
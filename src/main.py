@@ -1,38 +1,154 @@
-from fastapi import FastAPI, HTTPException, Depends, Query, UploadFile, File, Request
+from fastapi import FastAPI, HTTPException, Depends, Query, UploadFile, File
 import logging
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, field_validator, Field, AliasChoices
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, field_validator, model_validator, Field, AliasChoices
+from typing import List, Literal, Optional, Dict, Any, Tuple
 import os
 from dotenv import load_dotenv
-from datetime import datetime, date, timezone
+from datetime import datetime, date, timedelta, timezone
+from contextlib import asynccontextmanager
+import asyncio
 
-from .database import Base, engine, get_db
+from .database import Base, get_db, get_engine, get_sessionmaker
 from .models import CatSighting as CatSightingModel
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, insert, select
 from sqlalchemy import text as sql_text
 import io
 import csv
 import uuid
 import pathlib
+import time
+import functools
+import re
+import orjson
+import aiofiles
+import aiofiles.os
 
 load_dotenv()
 
-# Create tables if they don't exist (simple start; migrations recommended later)
-Base.metadata.create_all(bind=engine)
-# Lightweight migration: ensure spotted_at column exists
-try:
-    with engine.begin() as conn:
-        conn.execute(sql_text("ALTER TABLE cat_sightings ADD COLUMN IF NOT EXISTS spotted_at TIMESTAMPTZ"))
-except Exception:
-    # Best-effort; avoid crashing app if migration fails in a non-Postgres env
-    pass
-
-app = FastAPI(title="NYC Cat Tracker API")
-logging.basicConfig(level=logging.INFO)
+# Arbitrary app-wide key for pg advisory locks guarding startup DDL
+MIGRATION_LOCK_ID = 7_242_001
+
+async def run_migrations() -> None:
+    """Create tables and apply lightweight migrations, once per deploy.
+
+    Every uvicorn worker runs the lifespan, so the DDL is serialized with a
+    transaction-scoped advisory lock. The other workers wait on it, then see an
+    up-to-date schema and skip the DDL instead of serving before tables exist.
+    """
+    async with get_engine().begin() as conn:
+        await conn.execute(sql_text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+        current = (await conn.execute(sql_text("""
+            SELECT count(*) FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = 'cat_sightings'
+              AND (column_name = 'spotted_at'
+                   OR (column_name = 'source' AND udt_schema = current_schema() AND udt_name = 'cat_source'))
+        """))).scalar()
+        if current == 2:
+            return
+        # Create tables if they don't exist (simple start; migrations recommended later)
+        await conn.run_sync(Base.metadata.create_all)
+        # Lightweight migrations for tables created before these were added to the model
+        try:
+            async with conn.begin_nested():
+                await conn.execute(sql_text("ALTER TABLE cat_sightings ADD COLUMN IF NOT EXISTS spotted_at TIMESTAMPTZ"))
+                # source moved from VARCHAR + CHECK to the cat_source enum; convert once
+                await conn.execute(sql_text("""
+                    DO $$
+                    BEGIN
+                        -- Scope lookups to current_schema(): other visible schemas may
+                        -- have their own cat_sightings / cat_source
+                        IF NOT EXISTS (
+                            SELECT 1 FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace
+                            WHERE t.typname = 'cat_source' AND n.nspname = current_schema()
+                        ) THEN
+                            CREATE TYPE cat_source AS ENUM ('map', 'address');
+                        END IF;
+                        IF (SELECT udt_name FROM information_schema.columns
+                            WHERE table_schema = current_schema() AND table_name = 'cat_sightings'
+                              AND column_name = 'source') <> 'cat_source' THEN
+                            ALTER TABLE cat_sightings DROP CONSTRAINT IF EXISTS cat_sightings_source_check;
+                            ALTER TABLE cat_sightings ALTER COLUMN source TYPE cat_source USING source::cat_source;
+                        END IF;
+                    END $$
+                """))
+        except Exception:
+            # Best-effort, as before: the savepoint keeps create_all, and requests surface DB errors
+            logger.exception("Lightweight migrations failed")
+
+INDEX_LOCK_ID = MIGRATION_LOCK_ID + 1
+
+# Indexes added after cat_sightings already existed. Fresh tables get them from
+# create_all; existing ones are built CONCURRENTLY so inserts are not blocked.
+CONCURRENT_INDEXES = {
+    "ix_cat_sightings_created_at_source": "ON cat_sightings (created_at, source)",
+}
+
+async def build_indexes() -> None:
+    """Create missing CONCURRENT_INDEXES without taking a write-blocking lock.
+
+    CREATE INDEX CONCURRENTLY cannot run inside a transaction, so this uses an
+    autocommit connection and a session-level advisory lock. Workers that do not
+    get the lock skip; the indexes only affect performance.
+    """
+    if os.getenv("DB_PGBOUNCER") == "1":
+        # Session-level advisory locks do not survive transaction pooling
+        logger.warning("Skipping concurrent index builds behind PgBouncer; run them against Postgres directly")
+        return
+    async with get_engine().connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        locked = (await conn.execute(
+            sql_text("SELECT pg_try_advisory_lock(:id)"), {"id": INDEX_LOCK_ID}
+        )).scalar()
+        if not locked:
+            return
+        try:
+            for name, definition in CONCURRENT_INDEXES.items():
+                # An interrupted build leaves an INVALID index that IF NOT EXISTS would keep forever
+                invalid = (await conn.execute(sql_text(
+                    "SELECT NOT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                    "WHERE c.relname = :name"
+                ), {"name": name})).scalar()
+                if invalid:
+                    await conn.execute(sql_text(f"DROP INDEX CONCURRENTLY {name}"))
+                await conn.execute(sql_text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}"))
+        except Exception:
+            logger.exception("Concurrent index build failed")
+        finally:
+            await conn.execute(sql_text("SELECT pg_advisory_unlock(:id)"), {"id": INDEX_LOCK_ID})
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    index_task = None
+    # Set DB_AUTO_MIGRATE=0 when schema changes are applied by a separate deploy step
+    if os.getenv("DB_AUTO_MIGRATE", "1") == "1":
+        await run_migrations()
+        # Can take a while on a large table; serve requests meanwhile
+        index_task = asyncio.create_task(build_indexes())
+    yield
+    if index_task is not None and not index_task.done():
+        # An interrupted build is dropped and retried on the next start
+        index_task.cancel()
+        try:
+            await index_task
+        except (asyncio.CancelledError, Exception):
+            pass
+    # Only dispose if something actually created the engine
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
+
+class AppJSONResponse(ORJSONResponse):
+    """orjson response that writes UTC as "Z", matching Pydantic-serialized endpoints."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+# orjson serializes datetimes natively in C; used for every JSON response
+app = FastAPI(title="NYC Cat Tracker API", lifespan=lifespan, default_response_class=AppJSONResponse)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
 logger = logging.getLogger("cat-api")
 
 # CORS middleware
@@ -49,9 +165,56 @@ app.add_middleware(
 
 # Static uploads directory
 UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_MB", "10")) * 1024 * 1024
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 app.mount("/uploads", StaticFiles(directory=UPLOAD_DIR), name="uploads")
 
+# YYYY-MM-DD with optional [T ]HH:MM[:SS[.ffffff]] and Z / ±HH[:]MM offset
+_ISO_DATETIME_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6})\d*)?)?"
+    r"(Z|[+-]\d{2}:?\d{2})?)?"
+)
+
+def _parse_iso_datetime(s: str) -> Optional[datetime]:
+    """Parse the common ISO 8601 shapes without raising on the happy path.
+
+    Date-only values map to noon UTC so they stay on the same calendar day when
+    shown in US timezones. Naive datetimes are treated as UTC.
+    """
+    m = _ISO_DATETIME_RE.fullmatch(s)
+    if m is None:
+        # Uncommon shapes (e.g. basic format 20240501); let the stdlib decide,
+        # keeping the noon rule for date-only values
+        try:
+            d = date.fromisoformat(s)
+        except ValueError:
+            pass
+        else:
+            return datetime(d.year, d.month, d.day, 12, 0, tzinfo=timezone.utc)
+        try:
+            dt = datetime.fromisoformat(s)
+        except ValueError:
+            return None
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    year, month, day, hh, mm, ss, frac, tz = m.groups()
+    try:
+        if hh is None:
+            return datetime(int(year), int(month), int(day), 12, 0, tzinfo=timezone.utc)
+        if not tz or tz == "Z":
+            tzinfo = timezone.utc
+        else:
+            offset = timedelta(hours=int(tz[1:3]), minutes=int(tz[-2:]))
+            tzinfo = timezone(-offset if tz[0] == "-" else offset)
+        return datetime(
+            int(year), int(month), int(day), int(hh), int(mm), int(ss or 0),
+            int(frac.ljust(6, "0")) if frac else 0,
+            tzinfo=tzinfo,
+        )
+    except ValueError:
+        # Out-of-range fields, e.g. month 13
+        return None
+
 # Pydantic models for request/response
 class CatSightingCreate(BaseModel):
     lat: float
@@ -59,11 +222,23 @@ class CatSightingCreate(BaseModel):
     address: Optional[str] = None
     description: Optional[str] = None
     # Accept both snake_case and camelCase
-    cat_name: Optional[str] = Field(default=None, validation_alias=AliasChoices("cat_name", "catName"))
+    cat_name: Optional[str] = Field(default=None, validation_alias=AliasChoices("cat_name", "catName", "CatName", "cat_Name"))
     image_url: Optional[str] = Field(default=None, validation_alias=AliasChoices("image_url", "imageUrl"))
-    source: Optional[str] = "map"
+    source: Optional[Literal["map", "address"]] = "map"
     spotted_at: Optional[datetime] = Field(default=None, validation_alias=AliasChoices("spotted_at", "spottedAt"))
 
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize_cat_name_key(cls, data: Any) -> Any:
+        # Last resort for other naming variations (e.g. "Cat_Name", "petCatName")
+        if not isinstance(data, dict) or any(k in data for k in ("cat_name", "catName", "CatName", "cat_Name")):
+            return data
+        for k, v in data.items():
+            nk = str(k).replace("_", "").lower()
+            if nk.endswith("catname"):
+                return {**data, "cat_name": v}
+        return data
+
     @field_validator("spotted_at", mode="before")
     @classmethod
     def _parse_spotted_at(cls, v: Optional[object]) -> Optional[datetime]:
@@ -80,23 +255,7 @@ class CatSightingCreate(BaseModel):
                 return None
         if isinstance(v, str):
             s = v.strip()
-            if not s:
-                return None
-            # Handle trailing Z (UTC)
-            if s.endswith("Z"):
-                s = s[:-1] + "+00:00"
-            # Try full datetime first
-            try:
-                dt = datetime.fromisoformat(s)
-                return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
-            except Exception:
-                pass
-            # Try date-only: YYYY-MM-DD
-            try:
-                d = date.fromisoformat(s)
-                return datetime(d.year, d.month, d.day, 12, 0, tzinfo=timezone.utc)
-            except Exception:
-                return None
+            return _parse_iso_datetime(s) if s else None
         return None
 
 class CatSightingResponse(BaseModel):
@@ -115,6 +274,22 @@ class CatSightingResponse(BaseModel):
     class Config:
         from_attributes = True
 
+# Column projection matching CatSightingResponse / the CSV export layout. Selecting
+# these directly skips ORM entity construction for read-only list endpoints.
+SIGHTING_COLUMNS = (
+    CatSightingModel.id,
+    CatSightingModel.lat,
+    CatSightingModel.lng,
+    CatSightingModel.address,
+    CatSightingModel.description,
+    CatSightingModel.cat_name,
+    CatSightingModel.image_url,
+    CatSightingModel.source,
+    CatSightingModel.spotted_at,
+    CatSightingModel.created_at,
+    CatSightingModel.updated_at,
+)
+
 class ReportsSummaryResponse(BaseModel):
     total: int
     by_source: Dict[str, int]
@@ -127,60 +302,79 @@ def read_root():
     return {"message": "NYC Cat Tracker API", "version": "1.0.0"}
 
 @app.get("/api/cats", response_model=List[CatSightingResponse])
-def get_cat_sightings(db: Session = Depends(get_db)):
-    rows = db.query(CatSightingModel).order_by(CatSightingModel.created_at.desc()).all()
-    return rows
+async def get_cat_sightings(
+    limit: int = Query(100, ge=1, le=1000, description="Max rows to return"),
+    cursor: Optional[int] = Query(None, description="Return rows with id below this (last id of previous page)"),
+    db: AsyncSession = Depends(get_db),
+):
+    # Keyset pagination on the primary key: newest first, no OFFSET scan cost
+    stmt = select(*SIGHTING_COLUMNS).order_by(CatSightingModel.id.desc()).limit(limit)
+    if cursor is not None:
+        stmt = stmt.where(CatSightingModel.id < cursor)
+    result = await db.execute(stmt)
+    # Returning a Response skips per-row Pydantic validation; response_model still documents the shape
+    return AppJSONResponse([dict(m) for m in result.mappings()])
+
+# Upper bound for POST /api/cats/bulk; keeps the multi-VALUES insert well under
+# Postgres' 32767 bind-parameter limit (8 columns per row).
+MAX_BULK_SIGHTINGS = 1000
+
+def _sighting_values(sighting: CatSightingCreate) -> Dict[str, Any]:
+    return {
+        "lat": sighting.lat,
+        "lng": sighting.lng,
+        "address": sighting.address,
+        "description": sighting.description,
+        "cat_name": sighting.cat_name,
+        "image_url": sighting.image_url,
+        "source": sighting.source or "map",
+        # Default spotted_at to now if omitted
+        "spotted_at": sighting.spotted_at or datetime.now(timezone.utc),
+    }
 
 @app.post("/api/cats", response_model=CatSightingResponse, status_code=201)
-async def create_cat_sighting(sighting: CatSightingCreate, request: Request, db: Session = Depends(get_db)):
-    # Default spotted_at to now if omitted
-    spotted_at = sighting.spotted_at or datetime.now(timezone.utc)
-    # Prefer explicit body keys as a last resort to capture any naming variations
-    try:
-        raw = await request.json()
-    except Exception:
-        raw = {}
-    # Try multiple variants for cat name
-    cat_name_val = sighting.cat_name or raw.get("cat_name") or raw.get("catName")
-    if cat_name_val is None and isinstance(raw, dict):
-        for k, v in raw.items():
-            try:
-                nk = str(k).replace("_", "").lower()
-            except Exception:
-                continue
-            if nk == "catname" or nk.endswith("catname"):
-                cat_name_val = v
-                break
-
-    row = CatSightingModel(
-        lat=sighting.lat,
-        lng=sighting.lng,
-        address=sighting.address,
-        description=sighting.description,
-        cat_name=cat_name_val,
-        image_url=sighting.image_url,
-        source=sighting.source or "map",
-        spotted_at=spotted_at,
-    )
+async def create_cat_sighting(sighting: CatSightingCreate, db: AsyncSession = Depends(get_db)):
+    row = CatSightingModel(**_sighting_values(sighting))
     db.add(row)
-    db.commit()
-    db.refresh(row)
+    await db.commit()
+    await db.refresh(row)
+    # Other workers' caches expire within REPORTS_CACHE_TTL
+    _invalidate_reports_cache()
+    # Lazy %-args: nothing is formatted unless DEBUG is enabled
+    logger.debug("Saved cat sighting id=%s source=%s", row.id, row.source)
     return row
 
+@app.post("/api/cats/bulk", response_model=List[CatSightingResponse], status_code=201)
+async def create_cat_sightings_bulk(sightings: List[CatSightingCreate], db: AsyncSession = Depends(get_db)):
+    if len(sightings) > MAX_BULK_SIGHTINGS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BULK_SIGHTINGS} sightings per request")
+    if not sightings:
+        return AppJSONResponse([], status_code=201)
+    # Single multi-VALUES INSERT ... RETURNING instead of a round-trip per row
+    result = await db.execute(
+        insert(CatSightingModel)
+        .values([_sighting_values(s) for s in sightings])
+        .returning(*SIGHTING_COLUMNS)
+    )
+    rows = [dict(m) for m in result.mappings()]
+    await db.commit()
+    _invalidate_reports_cache()
+    logger.debug("Saved %s cat sightings", len(rows))
+    return AppJSONResponse(rows, status_code=201)
+
 @app.get("/api/cats/recent-with-images", response_model=List[CatSightingResponse])
-def get_recent_cats_with_images(db: Session = Depends(get_db)):
-    rows = (
-        db.query(CatSightingModel)
-        .filter(CatSightingModel.image_url.isnot(None))
+async def get_recent_cats_with_images(db: AsyncSession = Depends(get_db)):
+    result = await db.execute(
+        select(*SIGHTING_COLUMNS)
+        .where(CatSightingModel.image_url.isnot(None))
         .order_by(CatSightingModel.created_at.desc())
         .limit(10)
-        .all()
     )
-    return rows
+    return AppJSONResponse([dict(m) for m in result.mappings()])
 
 @app.get("/api/cats/{sighting_id}", response_model=CatSightingResponse)
-def get_cat_sighting(sighting_id: int, db: Session = Depends(get_db)):
-    row = db.query(CatSightingModel).filter(CatSightingModel.id == sighting_id).first()
+async def get_cat_sighting(sighting_id: int, db: AsyncSession = Depends(get_db)):
+    row = await db.get(CatSightingModel, sighting_id)
     if not row:
         raise HTTPException(status_code=404, detail="Cat sighting not found")
     return row
@@ -195,145 +389,183 @@ async def upload_image(file: UploadFile = File(...)):
         ext = ".jpg"
     name = f"{uuid.uuid4().hex}{ext}"
     dest_path = pathlib.Path(UPLOAD_DIR) / name
+    # Write to a temp name and rename once complete so partial files are never served
+    tmp_path = dest_path.with_name(f".{name}.part")
+    written = 0
     try:
-        with dest_path.open("wb") as out:
-            while True:
-                chunk = await file.read(1024 * 1024)
-                if not chunk:
-                    break
-                out.write(chunk)
+        async with aiofiles.open(tmp_path, "wb") as out:
+            while chunk := await file.read(1024 * 1024):
+                written += len(chunk)
+                if written > MAX_UPLOAD_BYTES:
+                    raise HTTPException(status_code=413, detail="File too large")
+                await out.write(chunk)
+        await aiofiles.os.replace(tmp_path, dest_path)
+    except BaseException:
+        try:
+            await aiofiles.os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
     finally:
-        await file.aclose()
+        await file.close()
     return {"url": f"/uploads/{name}"}
 
-def _parse_date_range(start: Optional[str], end: Optional[str]) -> (datetime, datetime):
+# Per-worker TTL cache for /api/reports/summary keyed by the raw (start, end) query
+# params. Dashboards poll it; the aggregate barely changes between inserts.
+REPORTS_CACHE_TTL = float(os.getenv("REPORTS_CACHE_TTL", "30"))
+_REPORTS_CACHE_MAX = 256
+_summary_cache: Dict[Tuple[Optional[str], Optional[str]], Tuple[float, "ReportsSummaryResponse"]] = {}
+
+def _invalidate_reports_cache() -> None:
+    _summary_cache.clear()
+
+@functools.lru_cache(maxsize=256)
+def _day_bounds(day: str) -> Tuple[datetime, datetime]:
+    """Return (start of day, end of day) for a YYYY-MM-DD string as aware local datetimes."""
+    # Keep the calendar date the client sent, even if the value carries an offset
+    d = datetime.fromisoformat(day).date()
+    # Localize each bound separately so DST-change days get the right offset at each end
+    return (
+        datetime.combine(d, datetime.min.time()).astimezone(),
+        datetime.combine(d, datetime.max.time()).astimezone(),
+    )
+
+def _parse_date_range(start: Optional[str], end: Optional[str]) -> Tuple[datetime, datetime]:
     """Parse ISO date strings (YYYY-MM-DD) into inclusive datetime bounds in local time.
     If missing, default to last 30 days.
     """
-    now = datetime.now()
-    if not end:
-        end_dt = now
-    else:
-        # end of day
-        end_dt = datetime.fromisoformat(end)
-        end_dt = end_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
-    if not start:
-        start_dt = datetime.fromtimestamp(end_dt.timestamp() - 29 * 24 * 3600)
-    else:
-        start_dt = datetime.fromisoformat(start)
-        start_dt = start_dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    # Aware datetimes so Postgres compares against TIMESTAMPTZ without casting
+    end_dt = _day_bounds(end)[1] if end else datetime.now().astimezone()
+    start_dt = _day_bounds(start)[0] if start else end_dt - timedelta(days=29)
     return start_dt, end_dt
 
 @app.get("/api/reports/summary", response_model=ReportsSummaryResponse)
-def get_reports_summary(
+async def get_reports_summary(
     start: Optional[str] = Query(None, description="Start date YYYY-MM-DD"),
     end: Optional[str] = Query(None, description="End date YYYY-MM-DD"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
+    cache_key = (start, end)
+    cached = _summary_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
     start_dt, end_dt = _parse_date_range(start, end)
 
-    base_q = db.query(CatSightingModel).filter(
+    in_range = (
         CatSightingModel.created_at >= start_dt,
         CatSightingModel.created_at <= end_dt,
     )
 
-    total = base_q.count()
+    # One scan grouped by (day, source); total, by_source and per_day are all
+    # reduced from these rows instead of issuing three queries over the same range.
+    # count(*) rather than count(id) keeps it an index-only scan on (created_at, source).
+    day = func.date(CatSightingModel.created_at)
+    rows = (await db.execute(
+        select(day, CatSightingModel.source, func.count())
+        .where(*in_range)
+        .group_by(day, CatSightingModel.source)
+        .order_by(day)
+    )).all()
 
-    # by source
-    src_rows = (
-        db.query(CatSightingModel.source, func.count(CatSightingModel.id))
-        .filter(
-            CatSightingModel.created_at >= start_dt,
-            CatSightingModel.created_at <= end_dt,
-        )
-        .group_by(CatSightingModel.source)
-        .all()
-    )
-    by_source: Dict[str, int] = {s or "unknown": c for s, c in src_rows}
-
-    # per day counts (using date(created_at))
-    day_rows = (
-        db.query(func.date(CatSightingModel.created_at), func.count(CatSightingModel.id))
-        .filter(
-            CatSightingModel.created_at >= start_dt,
-            CatSightingModel.created_at <= end_dt,
-        )
-        .group_by(func.date(CatSightingModel.created_at))
-        .order_by(func.date(CatSightingModel.created_at))
-        .all()
-    )
+    total = 0
+    by_source: Dict[str, int] = {}
+    day_counts: Dict[str, int] = {}
+    for d, src, count in rows:
+        total += count
+        key = src or "unknown"
+        by_source[key] = by_source.get(key, 0) + count
+        day_counts[str(d)] = day_counts.get(str(d), 0) + count
     per_day = [
-        {"date": str(d), "count": count}
-        for d, count in day_rows
+        {"date": d, "count": count}
+        for d, count in day_counts.items()
     ]
 
-    return ReportsSummaryResponse(
+    summary = ReportsSummaryResponse(
         total=total,
         by_source=by_source,
         per_day=per_day,
         start=start_dt,
         end=end_dt,
     )
+    if REPORTS_CACHE_TTL > 0:
+        if len(_summary_cache) >= _REPORTS_CACHE_MAX:
+            _summary_cache.clear()
+        _summary_cache[cache_key] = (time.monotonic() + REPORTS_CACHE_TTL, summary)
+    return summary
 
 @app.get("/api/reports/export")
-def export_reports_csv(
+async def export_reports_csv(
     start: Optional[str] = Query(None, description="Start date YYYY-MM-DD"),
     end: Optional[str] = Query(None, description="End date YYYY-MM-DD"),
-    db: Session = Depends(get_db),
 ):
     start_dt, end_dt = _parse_date_range(start, end)
 
-    rows: List[CatSightingModel] = (
-        db.query(CatSightingModel)
-        .filter(
+    # Plain column tuples instead of ORM entities: no identity map or attribute instrumentation
+    stmt = (
+        select(*SIGHTING_COLUMNS)
+        .where(
             CatSightingModel.created_at >= start_dt,
             CatSightingModel.created_at <= end_dt,
         )
         .order_by(CatSightingModel.created_at.desc())
-        .all()
+        .execution_options(yield_per=1000)
     )
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "id",
-        "lat",
-        "lng",
-        "address",
-        "description",
-        "cat_name",
-        "image_url",
-        "source",
-        "spotted_at",
-        "created_at",
-        "updated_at",
-    ])
-    for r in rows:
+    async def generate():
+        output = io.StringIO()
+        writer = csv.writer(output)
+
+        def flush() -> str:
+            data = output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+            return data
+
         writer.writerow([
-            r.id,
-            r.lat,
-            r.lng,
-            r.address or "",
-            r.description or "",
-            r.cat_name or "",
-            r.image_url or "",
-            r.source,
-            r.spotted_at.isoformat() if getattr(r, "spotted_at", None) else "",
-            r.created_at.isoformat() if r.created_at else "",
-            r.updated_at.isoformat() if r.updated_at else "",
+            "id",
+            "lat",
+            "lng",
+            "address",
+            "description",
+            "cat_name",
+            "image_url",
+            "source",
+            "spotted_at",
+            "created_at",
+            "updated_at",
         ])
+        yield flush()
+
+        # The request-scoped session from get_db is closed before the body is
+        # streamed, so open a dedicated one for the server-side cursor.
+        async with get_sessionmaker()() as db:
+            result = await db.stream(stmt)
+            # One chunk sent per yield_per batch. id/lat/lng never need quoting, so
+            # they are written directly and only the remaining fields go through csv.
+            async for partition in result.partitions():
+                for (
+                    id_, lat, lng, address, description, cat_name,
+                    image_url, source, spotted_at, created_at, updated_at,
+                ) in partition:
+                    output.write(f"{id_},{lat},{lng},")
+                    writer.writerow((
+                        address or "",
+                        description or "",
+                        cat_name or "",
+                        image_url or "",
+                        source,
+                        spotted_at.isoformat() if spotted_at else "",
+                        created_at.isoformat() if created_at else "",
+                        updated_at.isoformat() if updated_at else "",
+                    ))
+                yield flush()
 
-    output.seek(0)
-    filename = f"cat_sightings_{start_dt.date()}_to_{end_dt.date()}.csv"
+    filename = f"cat_sightings_{start_dt:%Y-%m-%d}_to_{end_dt:%Y-%m-%d}.csv"
     return StreamingResponse(
-        iter([output.getvalue()]),
+        generate(),
         media_type="text/csv",
         headers={
             "Content-Disposition": f"attachment; filename={filename}",
         },
     )
-
-if __name__ == "__main__":
-    import uvicorn
-    port = int(os.getenv("PORT", 5000))
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
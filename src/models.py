@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime, CheckConstraint
+from sqlalchemy import Column, Integer, Float, String, DateTime, Enum, Index
 from sqlalchemy.sql import func
 from .database import Base
 
@@ -12,12 +12,15 @@ class CatSighting(Base):
     description = Column(String, nullable=True)
     cat_name = Column(String, nullable=True)
     image_url = Column(String, nullable=True)
-    source = Column(String, nullable=False, default="map")  # 'map' | 'address'
+    # Native Postgres enum: 4 bytes per row and cheap GROUP BY in the reports summary
+    source = Column(Enum("map", "address", name="cat_source"), nullable=False, default="map")
     spotted_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     __table_args__ = (
-        CheckConstraint("source in ('map','address')", name="cat_sightings_source_check"),
+        # Serves ORDER BY created_at DESC (backward scan) and created_at range filters;
+        # source is included so the reports summary can be an index-only scan.
+        Index("ix_cat_sightings_created_at_source", "created_at", "source"),
     )
 
@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# src.main creates and mounts UPLOAD_DIR at import; keep it out of the working tree
+os.environ.setdefault("UPLOAD_DIR", tempfile.mkdtemp(prefix="cat-uploads-"))
@@ -0,0 +1,31 @@
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from src.main import CatSightingCreate
+
+
+@pytest.mark.parametrize("source", ["map", "address"])
+def test_known_sources(source):
+    assert CatSightingCreate(lat=40.7, lng=-73.9, source=source).source == source
+
+
+def test_source_defaults_to_map():
+    assert CatSightingCreate(lat=40.7, lng=-73.9).source == "map"
+
+
+def test_unknown_source_is_rejected():
+    with pytest.raises(ValidationError) as exc:
+        CatSightingCreate(lat=40.7, lng=-73.9, source="bogus")
+    assert exc.value.errors()[0]["loc"] == ("source",)
+
+
+def test_bulk_error_points_at_offending_item():
+    rows = [
+        {"lat": 40.7, "lng": -73.9, "source": "map"},
+        {"lat": 40.7, "lng": -73.9, "source": "bogus"},
+    ]
+    with pytest.raises(ValidationError) as exc:
+        TypeAdapter(List[CatSightingCreate]).validate_python(rows)
+    assert exc.value.errors()[0]["loc"] == (1, "source")
@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.main import CatSightingCreate
+
+
+def parse(value):
+    return CatSightingCreate(lat=40.7, lng=-73.9, spotted_at=value).spotted_at
+
+
+@pytest.mark.parametrize("value", ["2024-05-01", "20240501", " 2024-05-01 "])
+def test_date_only_is_noon_utc(value):
+    assert parse(value) == datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-05-01T10:20", datetime(2024, 5, 1, 10, 20, tzinfo=timezone.utc)),
+        ("2024-05-01T10:20:30Z", datetime(2024, 5, 1, 10, 20, 30, tzinfo=timezone.utc)),
+        ("2024-05-01 10:20:30.123", datetime(2024, 5, 1, 10, 20, 30, 123000, tzinfo=timezone.utc)),
+        (
+            "2024-05-01T10:20:30-05:00",
+            datetime(2024, 5, 1, 10, 20, 30, tzinfo=timezone(timedelta(hours=-5))),
+        ),
+        (
+            "2024-05-01T10:20:30.1234567+0530",
+            datetime(2024, 5, 1, 10, 20, 30, 123456, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+        ),
+        # Basic-format datetime goes through the fromisoformat fallback
+        ("20240501T102030", datetime(2024, 5, 1, 10, 20, 30, tzinfo=timezone.utc)),
+    ],
+)
+def test_datetimes(value, expected):
+    dt = parse(value)
+    assert dt == expected
+    assert dt.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize("value", ["2024-13-01", "2024-05-01T25:00", "garbage", ""])
+def test_invalid_is_none(value):
+    assert parse(value) is None
+
+
+def test_non_string_inputs():
+    assert parse(None) is None
+    assert parse(0) == datetime(1970, 1, 1, tzinfo=timezone.utc)
+    assert parse(datetime(2024, 5, 1, 10, 0)) == datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc)
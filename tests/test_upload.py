@@ -0,0 +1,42 @@
+import asyncio
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from starlette.datastructures import Headers
+
+from src import main
+
+
+def make_upload(data: bytes, filename: str = "cat.png") -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(data),
+        filename=filename,
+        headers=Headers({"content-type": "image/png"}),
+    )
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "UPLOAD_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_upload_writes_file(upload_dir):
+    data = b"\x89PNG" + b"x" * 2048
+    result = asyncio.run(main.upload_image(make_upload(data)))
+
+    name = result["url"].removeprefix("/uploads/")
+    assert name.endswith(".png")
+    assert (upload_dir / name).read_bytes() == data
+    assert [p.name for p in upload_dir.iterdir()] == [name]
+
+
+def test_upload_over_limit_is_413_and_cleans_up(upload_dir, monkeypatch):
+    monkeypatch.setattr(main, "MAX_UPLOAD_BYTES", 1024)
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(main.upload_image(make_upload(b"x" * 4096)))
+
+    assert exc.value.status_code == 413
+    assert list(upload_dir.iterdir()) == []